@@ -5,25 +5,33 @@ Connects to MCP RSS server, scores articles with Ollama, formats and sends diges
 """
 
 import asyncio
-import json
+import io
 import logging
+import re
 import sys
+from collections import defaultdict
 from contextlib import AsyncExitStack
+from datetime import datetime
+from hashlib import blake2b
 from pathlib import Path
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
-from langgraph.graph import StateGraph, START, END
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+import numpy as np
+import orjson
+from rapidfuzz import fuzz, process
 
-from models import Article
+from cache import ScoreCache
+from models import Article, ArticleTable
 from tools.ollama_tools import (
     check_ollama_available,
     get_llm,
     load_user_interests,
-    score_and_summarize_article,
+    score_and_summarize_batch,
 )
 
+if TYPE_CHECKING:
+    from mcp import ClientSession
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,11 +52,16 @@ class MCPClient:
     """Client for communicating with MCP RSS server."""
 
     def __init__(self):
-        self.session: ClientSession | None = None
+        self.session: "ClientSession | None" = None
         self.exit_stack = AsyncExitStack()
 
     async def connect(self):
         """Connect to the MCP RSS server."""
+        # Imported here, like langgraph in build_graph, to keep ~0.4s off
+        # `import agent` (langchain in tools.ollama_tools is most of the rest)
+        from mcp import ClientSession, StdioServerParameters
+        from mcp.client.stdio import stdio_client
+
         server_path = Path(__file__).parent / "mcp_rss_server.py"
 
         server_params = StdioServerParameters(
@@ -87,13 +100,14 @@ class MCPClient:
 
         result = await self.session.call_tool("fetch_feeds", arguments)
 
-        # Parse response
-        if result.content and len(result.content) > 0:
-            text = result.content[0].text
-            data = json.loads(text)
-            return data.get("articles", [])
+        # Parse response; each text part is its own JSON document
+        articles = []
+        for content in result.content or []:
+            text = getattr(content, "text", None)
+            if text:
+                articles.extend(orjson.loads(text).get("articles", []))
 
-        return []
+        return articles
 
     async def close(self):
         """Close the MCP connection."""
@@ -117,80 +131,201 @@ async def fetch_node(state: DigestState, mcp_client: MCPClient) -> dict:
         return {"error": f"Fetch failed: {e}"}
 
 
-def dedupe_articles(articles: list[dict], threshold: int = 85) -> list[dict]:
-    """Remove duplicate articles by title similarity."""
-    from rapidfuzz import fuzz
-
-    if not articles:
-        return []
-
-    unique = []
-    seen_titles = []
+# MinHash LSH over per-word 3-gram shingles: 32 bands x 2 rows. Titles that
+# share any band become candidates and are verified with rapidfuzz, so
+# only a handful of fuzzy checks run per article. Shingles never span words,
+# so reordered titles still collide.
+MINHASH_BANDS = 32
+MINHASH_ROWS = 2
+SHINGLE_SIZE = 3
 
-    for article in articles:
-        title = article.get("title", "")
-        is_dupe = False
+# token_set_ratio is 100 when one title's words are a subset of the other's
+# ("Apple" vs "Apple unveils new iPhone"); a duplicate must also be this
+# close with fuzz.token_sort_ratio, which counts the extra words
+MIN_SORT_RATIO = 70
 
-        for seen in seen_titles:
-            if fuzz.ratio(title.lower(), seen.lower()) >= threshold:
-                is_dupe = True
-                break
+_MINHASH_MASKS = np.random.default_rng(0).integers(
+    0, 2**63, size=MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64
+)
 
-        if not is_dupe:
-            unique.append(article)
-            seen_titles.append(title)
+_WHITESPACE_RE = re.compile(r"\s+")
 
-    return unique
+# Trailing " - Source" / " — Source" / " | Source" added by republishers. Only
+# stripped when the suffix is at most 3 words and at least 4 words remain, so
+# headlines like "GPT-5 - What It Means" stay intact.
+_TITLE_SUFFIX_RE = re.compile(
+    r"^(?P<head>(?:\S+ ){3,}\S+) [-\u2013\u2014|] \w\S*(?: \w\S*){0,2}$"
+)
 
 
-def score_node(state: DigestState) -> dict:
-    """Score and summarize articles using Ollama."""
-    articles = state.get("raw_articles", [])
+def _normalize_title(title: str) -> str:
+    """Lowercase a title, collapse whitespace and drop a source suffix."""
+    title = _WHITESPACE_RE.sub(" ", title).strip().lower()
+    return _TITLE_SUFFIX_RE.sub(r"\g<head>", title)
+
+
+def _title_minhash(title: str) -> np.ndarray:
+    """Compute the MinHash signature of a title, shaped (bands, rows)."""
+    shingles = {
+        word[i:i + SHINGLE_SIZE]
+        for word in title.split()
+        for i in range(max(len(word) - SHINGLE_SIZE + 1, 1))
+    } or {title}
+    hashes = np.fromiter(
+        (
+            int.from_bytes(blake2b(s.encode(), digest_size=8).digest(), "little")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    signature = (hashes[:, None] ^ _MINHASH_MASKS).min(axis=0)
+    return signature.reshape(MINHASH_BANDS, MINHASH_ROWS)
+
+
+def dedupe_mask(titles: np.ndarray, threshold: int = 90) -> np.ndarray:
+    """
+    Find which titles to keep when removing near-duplicates.
+
+    Titles are kept greedily in input order. Titles identical to an earlier
+    one (after normalizing) are dropped without any fuzzy work. Otherwise a
+    title is checked only against kept titles sharing a MinHash LSH band with
+    it, and is a duplicate if any of them scores at least ``threshold`` with
+    fuzz.token_set_ratio, which ignores word order and extra words such as a
+    source name, and at least MIN_SORT_RATIO with fuzz.token_sort_ratio, so a
+    short title isn't swallowed by a longer one that merely contains it.
+
+    Returns:
+        Boolean mask, True for titles to keep.
+    """
+    kept = np.zeros(len(titles), dtype=bool)
+    seen_titles: set[str] = set()
+    kept_titles: list[str] = []
+    buckets: dict[tuple[int, bytes], list[int]] = {}
+
+    for row, title in enumerate(titles):
+        title = _normalize_title(title)
+        if title in seen_titles:
+            continue
+        seen_titles.add(title)
+
+        signature = _title_minhash(title)
+        keys = [(band, signature[band].tobytes()) for band in range(MINHASH_BANDS)]
+
+        candidates = {i for key in keys for i in buckets.get(key, ())}
+        if candidates and any(
+            fuzz.token_sort_ratio(title, match) >= MIN_SORT_RATIO
+            for match, _, _ in process.extract(
+                title,
+                [kept_titles[i] for i in candidates],
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=threshold,
+                limit=None,
+            )
+        ):
+            continue
+
+        for key in keys:
+            buckets.setdefault(key, []).append(len(kept_titles))
+        kept_titles.append(title)
+        kept[row] = True
+
+    return kept
+
+
+def dedupe_articles(articles: list[dict], threshold: int = 90) -> list[dict]:
+    """Remove duplicate articles by title similarity (see dedupe_mask)."""
+    table = ArticleTable.from_dicts(articles)
+    return table.take(dedupe_mask(table.titles, threshold)).rows
+
+
+async def score_node(state: DigestState) -> dict:
+    """Score and summarize articles concurrently using Ollama."""
+    table = ArticleTable.from_dicts(state.get("raw_articles", []))
     min_score = state.get("min_score", 6.0)
     max_articles = state.get("max_articles")
 
     # Deduplicate first
-    articles = dedupe_articles(articles)
-    logger.info(f"After dedup: {len(articles)} articles")
+    table = table.take(dedupe_mask(table.titles))
+    logger.info(f"After dedup: {len(table)} articles")
 
     # Limit for testing
     if max_articles:
-        articles = articles[:max_articles]
+        table = table.take(slice(max_articles))
 
-    logger.info(f"Scoring {len(articles)} articles with Ollama...")
-
-    try:
-        check_ollama_available()
-    except ConnectionError as e:
-        logger.error(str(e))
-        return {"error": str(e)}
+    articles = table.rows
 
     interests = load_user_interests()
     llm = get_llm()
 
-    scored = []
-    for i, article in enumerate(articles, 1):
-        title = article.get("title", "")
-        logger.info(f"  [{i}/{len(articles)}] {title[:50]}...")
-
-        score, summary = score_and_summarize_article(
-            title=title,
-            content=article.get("summary", ""),
-            source=article.get("source", ""),
-            interests=interests,
-            llm=llm,
+    # Reuse results for articles already scored in an earlier run
+    cache = ScoreCache()
+    try:
+        keys = [
+            ScoreCache.make_key(
+                a.get("title", ""),
+                a.get("summary", ""),
+                a.get("source", ""),
+                interests,
+                llm.model,
+            )
+            for a in articles
+        ]
+        results = cache.get_many(keys)
+        pending = [i for i, key in enumerate(keys) if key not in results]
+
+        logger.info(
+            f"Scoring {len(pending)} articles with Ollama "
+            f"({len(articles) - len(pending)} cached)..."
         )
 
+        if pending:
+            try:
+                check_ollama_available()
+            except ConnectionError as e:
+                logger.error(str(e))
+                return {"error": str(e)}
+
+            fresh = await score_and_summarize_batch(
+                [
+                    (
+                        articles[i].get("title", ""),
+                        articles[i].get("summary", ""),
+                        articles[i].get("source", ""),
+                    )
+                    for i in pending
+                ],
+                interests=interests,
+                llm=llm,
+            )
+
+            to_cache = {}
+            for i, result in zip(pending, fresh):
+                results[keys[i]] = result
+                # (0.0, "") means the LLM call failed; retry it next run
+                if result != (0.0, ""):
+                    to_cache[keys[i]] = result
+            cache.set_many(to_cache)
+    finally:
+        cache.close()
+
+    for row, (article, key) in enumerate(zip(articles, keys)):
+        score, summary = results[key]
         article["score"] = score
         article["ai_summary"] = summary
+        table.scores[row] = score
 
+        title = article.get("title", "")
         if score >= min_score:
-            scored.append(article)
-            logger.info(f"    Score: {score:.1f} - INCLUDED")
+            # Render-ready labels, computed once for format_node
+            article["_topic_label"] = article.get("topic", "general").upper()
+            article["_score_label"] = f"{score:.1f}"
+            logger.info(f"    Score: {article['_score_label']} - INCLUDED: {title[:50]}")
         else:
-            logger.debug(f"    Score: {score:.1f} - filtered")
+            logger.debug(f"    Score: {score:.1f} - filtered: {title[:50]}")
 
-    scored.sort(key=lambda a: a.get("score", 0), reverse=True)
+    passed = table.take(table.scores >= min_score)
+    scored = passed.take(np.argsort(-passed.scores, kind="stable")).rows
 
     logger.info(f"Scoring complete: {len(scored)} articles passed")
 
@@ -206,8 +341,6 @@ def score_node(state: DigestState) -> dict:
 
 def format_node(state: DigestState) -> dict:
     """Format articles into Markdown and HTML digest."""
-    from datetime import datetime
-
     articles = state.get("scored_articles", [])
     logger.info(f"Formatting digest with {len(articles)} articles...")
 
@@ -218,33 +351,33 @@ def format_node(state: DigestState) -> dict:
             "digest_html": f"<h1>Daily News Digest</h1><p>No relevant articles found.</p>",
         }
 
-    # Group by topic
-    by_topic: dict[str, list] = {}
+    # Group by topic (articles arrive score-sorted, so topics are ordered by
+    # their best article and each group stays score-sorted)
+    by_topic: defaultdict[str, list] = defaultdict(list)
     for article in articles:
-        topic = article.get("topic", "general").upper()
-        if topic not in by_topic:
-            by_topic[topic] = []
+        topic = article.get("_topic_label") or article.get("topic", "general").upper()
         by_topic[topic].append(article)
 
     # Build Markdown
     today = datetime.now().strftime("%A, %B %d, %Y")
-    md_parts = [f"# Daily News Digest\n*{today}*\n"]
+    out = io.StringIO()
+    out.write(f"# Daily News Digest\n*{today}*\n")
 
     for topic, topic_articles in by_topic.items():
-        md_parts.append(f"\n## {topic}\n")
+        out.write(f"\n\n## {topic}\n")
 
         for article in topic_articles:
             title = article.get("title", "Untitled")
             link = article.get("link", "#")
             source = article.get("source", "Unknown")
-            score = article.get("score", 0)
+            score = article.get("_score_label") or f"{article.get('score', 0):.1f}"
             summary = article.get("ai_summary") or article.get("summary", "")[:200]
 
-            md_parts.append(f"### [{title}]({link})")
-            md_parts.append(f"*{source}* | Score: {score:.1f}\n")
-            md_parts.append(f"{summary}\n")
+            out.write(
+                f"\n### [{title}]({link})\n*{source}* | Score: {score}\n\n{summary}\n"
+            )
 
-    markdown = "\n".join(md_parts)
+    markdown = out.getvalue()
 
     # Convert to HTML
     html = _markdown_to_html(markdown)
@@ -252,26 +385,54 @@ def format_node(state: DigestState) -> dict:
     return {"digest_markdown": markdown, "digest_html": html}
 
 
-def _markdown_to_html(markdown: str) -> str:
-    """Simple Markdown to HTML conversion with inline styles."""
-    import re
+# Inline Markdown: bold, italics, links
+_MD_INLINE = (
+    r"\*\*(?P<strong>.+?)\*\*"
+    r"|\*(?P<em>(?:\*\*.+?\*\*|[^*\n])+?)\*(?!\*)"
+    r"|\[(?P<link_text>.+?)\]\((?P<link_url>.+?)\)"
+)
+_MD_INLINE_RE = re.compile(_MD_INLINE)
+
+# Headers plus inline Markdown, handled in a single scan of the digest
+_MD_RE = re.compile(
+    r"^### \[(?P<h3_text>.+?)\]\((?P<h3_url>.+?)\)$"
+    r"|^## (?P<h2>.+)$"
+    r"|^# (?P<h1>.+)$"
+    r"|" + _MD_INLINE,
+    re.M,
+)
+_PARAGRAPH_RE = re.compile(r"\n\n+")
 
-    html = markdown
 
-    # Headers
-    html = re.sub(r"^# (.+)$", r"<h1>\1</h1>", html, flags=re.M)
-    html = re.sub(r"^## (.+)$", r"<h2>\1</h2>", html, flags=re.M)
-    html = re.sub(r"^### \[(.+?)\]\((.+?)\)$", r"<h3><a href='\2'>\1</a></h3>", html, flags=re.M)
+def _render_inline(text: str) -> str:
+    """Render inline Markdown inside an already matched construct."""
+    return _MD_INLINE_RE.sub(_render_markdown_match, text)
 
-    # Emphasis
-    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
-    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
 
-    # Links
-    html = re.sub(r"\[(.+?)\]\((.+?)\)", r"<a href='\2'>\1</a>", html)
+def _render_markdown_match(m: re.Match) -> str:
+    """Render one Markdown construct matched by _MD_RE or _MD_INLINE_RE."""
+    kind = m.lastgroup
+
+    if kind == "h3_url":
+        return f"<h3><a href='{m['h3_url']}'>{_render_inline(m['h3_text'])}</a></h3>"
+    if kind == "h2":
+        return f"<h2>{_render_inline(m['h2'])}</h2>"
+    if kind == "h1":
+        return f"<h1>{_render_inline(m['h1'])}</h1>"
+    if kind == "strong":
+        return f"<strong>{_render_inline(m['strong'])}</strong>"
+    if kind == "em":
+        return f"<em>{_render_inline(m['em'])}</em>"
+
+    return f"<a href='{m['link_url']}'>{_render_inline(m['link_text'])}</a>"
+
+
+def _markdown_to_html(markdown: str) -> str:
+    """Simple Markdown to HTML conversion with inline styles."""
+    html = _MD_RE.sub(_render_markdown_match, markdown)
 
     # Line breaks to paragraphs
-    html = re.sub(r"\n\n+", "</p><p>", html)
+    html = _PARAGRAPH_RE.sub("</p><p>", html)
 
     return f"""<!DOCTYPE html>
 <html>
@@ -286,7 +447,7 @@ a {{ color: #0066cc; }} em {{ color: #666; }}
 </html>"""
 
 
-def send_node(state: DigestState) -> dict:
+async def send_node(state: DigestState) -> dict:
     """Send digest via email."""
     dry_run = state.get("dry_run", False)
 
@@ -295,10 +456,10 @@ def send_node(state: DigestState) -> dict:
         return {"stats": {**state.get("stats", {}), "email_sent": False}}
 
     try:
-        from sender import send_digest
+        from sender import send_digest_async
 
         html = state.get("digest_html", "")
-        success = send_digest(html)
+        success = await send_digest_async(html)
         return {"stats": {**state.get("stats", {}), "email_sent": success}}
     except ImportError:
         logger.warning("Sender module not available")
@@ -310,6 +471,9 @@ def send_node(state: DigestState) -> dict:
 
 def build_graph():
     """Build the LangGraph pipeline."""
+    # Deferred like mcp in MCPClient.connect
+    from langgraph.graph import END, START, StateGraph
+
     graph = StateGraph(DigestState)
 
     graph.add_node("score", score_node)
@@ -357,9 +521,9 @@ async def run_pipeline(
         if initial_state.get("error"):
             return initial_state
 
-        # Run rest of pipeline synchronously
+        # Run rest of pipeline (score node is async)
         graph = build_graph()
-        result = graph.invoke(initial_state)
+        result = await graph.ainvoke(initial_state)
 
         logger.info(f"Pipeline complete. Stats: {result.get('stats', {})}")
         return result
@@ -0,0 +1,260 @@
+"""
+Persistent caches for the news aggregation agent.
+
+Backed by SQLite files in logs/ so repeated runs can skip redundant work
+(LLM scoring in the agent, feed downloads in the MCP server).
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+import orjson
+
+from models import Article
+
+CACHE_DIR = Path(__file__).parent.parent / "logs"
+
+
+class ScoreCache:
+    """
+    LRU cache of LLM (score, summary) results keyed by article content.
+
+    The same articles show up across overlapping feeds and same-day re-runs;
+    scoring is deterministic enough for a given (model, interests, article)
+    that the stored result can be reused instead of calling Ollama again.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_DIR / "score_cache.sqlite",
+        max_entries: int = 50_000,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file location.
+            max_entries: Entries kept before least-recently-used eviction.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            " key TEXT PRIMARY KEY,"
+            " score REAL NOT NULL,"
+            " summary TEXT NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)"
+        )
+
+    @staticmethod
+    def make_key(
+        title: str,
+        content: str,
+        source: str,
+        interests: str,
+        model: str,
+    ) -> str:
+        """Build the cache key for one article under a given model and interests."""
+        digest = hashlib.sha256()
+        for part in (model, interests, title, source, content):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, tuple[float, str]]:
+        """
+        Look up cached results and mark them as recently used.
+
+        Args:
+            keys: Cache keys from make_key().
+
+        Returns:
+            Mapping of found keys to (score, summary).
+        """
+        found: dict[str, tuple[float, str]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(unique_keys), 500):
+            chunk = unique_keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT key, score, summary FROM scores WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, score, summary in rows:
+                found[key] = (score, summary)
+
+        if found:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE scores SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+
+        return found
+
+    def set_many(self, results: dict[str, tuple[float, str]]) -> None:
+        """
+        Store results and evict the least-recently-used overflow.
+
+        Args:
+            results: Mapping of cache key to (score, summary).
+        """
+        if not results:
+            return
+
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO scores (key, score, summary, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, score, summary, now) for key, (score, summary) in results.items()],
+            )
+            self.conn.execute(
+                "DELETE FROM scores WHERE key IN ("
+                " SELECT key FROM scores ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+
+class FeedCache:
+    """
+    Per-feed HTTP validators and last fetched articles for conditional GETs.
+
+    When a feed answers 304 Not Modified, the articles from the previous
+    fetch are reused instead of downloading and parsing the feed again.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_DIR / "feed_cache.sqlite",
+        max_age_days: int = 30,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file location.
+            max_age_days: Feeds not fetched for this long (e.g. removed from
+                sources.yaml) are dropped.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS feeds ("
+            " url TEXT PRIMARY KEY,"
+            " etag TEXT,"
+            " modified TEXT,"
+            " max_articles INTEGER NOT NULL,"
+            " freshness_hours INTEGER NOT NULL,"
+            " articles TEXT NOT NULL,"
+            " last_fetched REAL NOT NULL DEFAULT 0)"
+        )
+
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM feeds WHERE last_fetched < ?",
+                (time.time() - max_age_days * 86400,),
+            )
+
+    def get(
+        self,
+        url: str,
+        max_articles: int,
+        freshness_hours: int,
+    ) -> tuple[str | None, str | None, list[Article]] | None:
+        """
+        Look up a feed's validators and cached articles.
+
+        Only returns an entry if it was fetched with limits at least as wide
+        as the ones requested, so the cached articles are a superset.
+
+        Args:
+            url: Feed URL.
+            max_articles: Requested max articles per feed.
+            freshness_hours: Requested freshness window.
+
+        Returns:
+            Tuple of (etag, last_modified, articles), or None.
+        """
+        row = self.conn.execute(
+            "SELECT etag, modified, articles FROM feeds"
+            " WHERE url = ? AND max_articles >= ? AND freshness_hours >= ?",
+            (url, max_articles, freshness_hours),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        etag, modified, articles_json = row
+        articles = [Article.from_dict(data) for data in orjson.loads(articles_json)]
+        return (etag, modified, articles)
+
+    def set(
+        self,
+        url: str,
+        etag: str | None,
+        modified: str | None,
+        max_articles: int,
+        freshness_hours: int,
+        articles: list[Article],
+    ) -> None:
+        """
+        Store a feed's validators and freshly fetched articles.
+
+        Args:
+            url: Feed URL.
+            etag: ETag response header, if any.
+            modified: Last-Modified response header, if any.
+            max_articles: Max articles per feed used for this fetch.
+            freshness_hours: Freshness window used for this fetch.
+            articles: Articles extracted from the feed.
+        """
+        if etag is None and modified is None:
+            return
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO feeds"
+                " (url, etag, modified, max_articles, freshness_hours, articles,"
+                " last_fetched)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    etag,
+                    modified,
+                    max_articles,
+                    freshness_hours,
+                    orjson.dumps(articles).decode(),
+                    time.time(),
+                ),
+            )
+
+    def touch(self, url: str) -> None:
+        """
+        Record that a feed was fetched and found unchanged (304).
+
+        Args:
+            url: Feed URL.
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE feeds SET last_fetched = ? WHERE url = ?",
+                (time.time(), url),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
@@ -0,0 +1,17 @@
+"""
+YAML config loading shared by the agent and the MCP server.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe subset
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the safe loader."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
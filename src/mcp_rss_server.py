@@ -13,18 +13,36 @@ Usage:
 """
 
 import asyncio
-import json
+import calendar
+import html
 import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import aiohttp
 import feedparser
-import yaml
+import orjson
+from cachetools import TTLCache
+# Private API; requirements.txt caps feedparser below 6.1 for it
+from feedparser.sanitizer import _sanitize_html
+from lxml import etree
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from cache import FeedCache
+from config import load_yaml
 from models import Article
 
 logger = logging.getLogger(__name__)
@@ -32,78 +50,473 @@ logger = logging.getLogger(__name__)
 # Create MCP server instance
 server = Server("rss-news-server")
 
-
+# Per-feed HTTP timeout in seconds
+FETCH_TIMEOUT = 15
+
+# Feeds downloaded at once; the rest wait for a free slot
+MAX_CONCURRENT_FETCHES = 20
+
+# Seconds a resolved feed hostname is reused
+DNS_CACHE_TTL = 300
+
+# Connections kept open to any one feed host
+MAX_CONNECTIONS_PER_HOST = 4
+
+# HTTP session shared by every tool call while run_server is running
+_SESSION: aiohttp.ClientSession | None = None
+
+# Articles per (feed_url, topic, freshness_hours, max_articles) from recent fetches,
+# so back-to-back fetch_feeds calls skip the network for 15 minutes
+_ARTICLE_CACHE: TTLCache = TTLCache(maxsize=64, ttl=900)
+
+# Title given to entries without one; never used to match duplicates
+DEFAULT_TITLE = "No title"
+
+# Consecutive entries older than the freshness window before a feed's
+# remaining entries are skipped
+STALE_STREAK_LIMIT = 3
+
+# feedparser is pure Python and holds the GIL; parse feeds on all cores.
+# Workers are spawned, not forked: forking while the stdio transport's
+# threads hold locks deadlocks the children.
+_PARSE_POOL = ProcessPoolExecutor(
+    max_workers=os.cpu_count(),
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
+# Feeds smaller than this are parsed by feedparser on the event loop
+INLINE_PARSE_MAX_BYTES = 50_000
+
+# Namespaces whose title/link/summary elements belong to the feed format
+# itself (RSS 2.0 has none); extension elements such as media:title are skipped
+_FEED_NAMESPACES = {
+    None,
+    "http://www.w3.org/2005/Atom",
+    "http://purl.org/atom/ns#",
+    "http://purl.org/rss/1.0/",
+}
+_DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+_ATOM_NAMESPACES = {"http://www.w3.org/2005/Atom", "http://purl.org/atom/ns#"}
+
+# Atom type="..." values (1.0 short names and 0.3 MIME types) by kind
+_TEXT_TYPES = {
+    "text": "text",
+    "text/plain": "text",
+    "html": "html",
+    "text/html": "html",
+    "xhtml": "xhtml",
+    "application/xhtml+xml": "xhtml",
+}
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@lru_cache(maxsize=1)
 def load_sources_config() -> dict:
-    """Load RSS feed sources from config/sources.yaml."""
+    """
+    Load RSS feed sources from config/sources.yaml.
+
+    Parsed once per process; call reload_config() after editing the file.
+    """
     config_path = Path(__file__).parent.parent / "config" / "sources.yaml"
 
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return load_yaml(config_path)
 
 
-def parse_published_date(entry: Any) -> datetime | None:
-    """Parse publication date from RSS entry."""
-    if hasattr(entry, "published_parsed") and entry.published_parsed:
-        try:
-            return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-        except (TypeError, ValueError):
-            pass
+def reload_config() -> dict:
+    """Re-read config/sources.yaml, dropping the cached copy."""
+    load_sources_config.cache_clear()
+    return load_sources_config()
 
-    if hasattr(entry, "updated_parsed") and entry.updated_parsed:
+
+def parse_date_string(value: str) -> datetime | None:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date string as UTC."""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
         try:
-            return datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-        except (TypeError, ValueError):
-            pass
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_published_timestamp(entry: Any) -> float | None:
+    """Parse publication date from RSS entry as a UTC epoch timestamp."""
+    for key in ("published_parsed", "updated_parsed"):
+        parsed = entry.get(key)
+        if parsed:
+            try:
+                return float(calendar.timegm(parsed))
+            except (TypeError, ValueError, OverflowError):
+                continue
+
+    # Raw date strings (entries from parse_feed_lxml)
+    for key in ("published", "updated"):
+        value = entry.get(key)
+        if value:
+            parsed = parse_date_string(value)
+            if parsed:
+                return parsed.timestamp()
 
     return None
 
 
-def is_fresh(published: datetime | None, hours: int) -> bool:
-    """Check if article is within freshness window."""
-    if published is None:
-        return True
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    return published >= cutoff
+def freshness_cutoff(hours: int) -> float:
+    """UTC epoch timestamp of the oldest publication date still fresh."""
+    return (datetime.now(timezone.utc) - timedelta(hours=hours)).timestamp()
 
 
-def fetch_single_feed(
+def is_fresh(published: float | None, cutoff: float) -> bool:
+    """Check if a publication timestamp is within the freshness window."""
+    return published is None or published >= cutoff
+
+
+def _element_text(element: Any) -> str:
+    """Text content of an element, including any nested markup."""
+    return "".join(element.itertext()).strip()
+
+
+def _text_kind(element: Any) -> str:
+    """'text', 'html' or 'xhtml' for an Atom text construct or RSS element."""
+    kind = _TEXT_TYPES.get(element.get("type", "").lower())
+    if kind:
+        return kind
+    # Atom defaults to plain text; RSS fields are (escaped) HTML
+    return "text" if etree.QName(element).namespace in _ATOM_NAMESPACES else "html"
+
+
+def _element_title(element: Any) -> str:
+    """Plain-text title, with HTML tags and entities resolved."""
+    text = _element_text(element)
+    if _text_kind(element) == "html":
+        text = html.unescape(_TAG_RE.sub("", text)).strip()
+    return text
+
+
+def _element_html(element: Any) -> str:
+    """Summary or content markup, sanitized the way feedparser does."""
+    kind = _text_kind(element)
+    if kind == "text":
+        return _element_text(element)
+
+    if kind == "xhtml":
+        # Markup inside the wrapping <div>, without the <div> itself
+        if len(element) and etree.QName(element[0]).localname == "div":
+            element = element[0]
+        markup = etree.tostring(element, encoding="unicode", method="html", with_tail=False)
+        start, end = markup.find(">") + 1, markup.rfind("</")
+        markup = markup[start:end] if end >= start else ""
+    else:
+        markup = _element_text(element)
+
+    # Drops <script>, <iframe>, on* handlers and the like
+    if "<" in markup:
+        markup = _sanitize_html(markup, "utf-8", "text/html")
+    return markup.strip()
+
+
+def _entry_from_element(item: Any) -> feedparser.FeedParserDict:
+    """Extract the fields we use from an RSS <item> or Atom <entry>."""
+    entry = feedparser.FeedParserDict()
+    content = None
+
+    for child in item:
+        if not isinstance(child.tag, str):
+            continue  # comments and processing instructions
+
+        qname = etree.QName(child)
+        name = qname.localname
+
+        if qname.namespace == _DC_NAMESPACE:
+            if name == "date":
+                entry.setdefault("published", _element_text(child))
+            continue
+
+        if qname.namespace not in _FEED_NAMESPACES:
+            continue
+
+        if name == "title":
+            entry.setdefault("title", _element_title(child))
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                entry.setdefault("link", _element_text(child))
+            elif child.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", href)
+        elif name in ("description", "summary"):
+            entry.setdefault("summary", _element_html(child))
+        elif name == "content" and content is None:
+            content = _element_html(child)
+        elif name in ("pubDate", "published", "issued"):
+            entry.setdefault("published", _element_text(child))
+        elif name in ("updated", "modified"):
+            entry.setdefault("updated", _element_text(child))
+
+    # Atom entries may carry only <content>
+    if content and "summary" not in entry:
+        entry["summary"] = content
+
+    return entry
+
+
+def parse_feed_lxml(body: bytes) -> feedparser.FeedParserDict | None:
+    """
+    Parse a well-formed RSS/Atom body with lxml (libxml2).
+
+    Only reads the fields extract_articles uses, and streams items so memory
+    stays flat. Returns a feedparser-shaped result, or None if the body is
+    not well-formed XML or has no items, in which case callers fall back to
+    feedparser's lenient parser.
+    """
+    source_title = None
+    entries = []
+
+    try:
+        for _, element in etree.iterparse(
+            BytesIO(body),
+            events=("end",),
+            resolve_entities=False,
+            no_network=True,
+        ):
+            if not isinstance(element.tag, str):
+                continue
+
+            name = etree.QName(element).localname
+
+            if name in ("item", "entry"):
+                entries.append(_entry_from_element(element))
+
+                # Free parsed items as we go
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+            elif name == "title" and source_title is None:
+                parent = element.getparent()
+                if parent is not None and etree.QName(parent).localname in ("channel", "feed"):
+                    source_title = _element_title(element)
+
+    except etree.XMLSyntaxError:
+        return None
+
+    if not entries:
+        return None
+
+    feed_info = feedparser.FeedParserDict()
+    if source_title:
+        feed_info["title"] = source_title
+
+    return feedparser.FeedParserDict(bozo=False, feed=feed_info, entries=entries)
+
+
+def parse_feed(
+    body: bytes,
+    content_type: str | None = None,
+) -> feedparser.FeedParserDict:
+    """
+    Parse a feed body with feedparser (runs in the parse process pool).
+
+    The HTTP Content-Type, when known, is handed to feedparser so it takes
+    the charset from the header rather than guessing it from the bytes.
+
+    The bozo exception is replaced by its message, since XML parser
+    exceptions do not survive pickling back to the event loop process.
+    """
+    response_headers = {"content-type": content_type} if content_type else None
+    feed = feedparser.parse(body, response_headers=response_headers)
+    if feed.get("bozo_exception") is not None:
+        feed["bozo_exception"] = str(feed["bozo_exception"])
+    return feed
+
+
+def _entry_fields(entry: Any) -> tuple[str, str, str]:
+    """Title, link and summary of a feed entry, with defaults."""
+    get = entry.get
+    return (
+        get("title", DEFAULT_TITLE),
+        get("link", ""),
+        get("summary") or get("description") or "",
+    )
+
+
+def extract_articles(
+    feed: Any,
     feed_url: str,
     topic: str,
     max_articles: int = 50,
     freshness_hours: int = 24,
+    cutoff: float | None = None,
 ) -> list[Article]:
-    """Fetch articles from a single RSS feed."""
-    logger.info(f"Fetching: {feed_url}")
+    """
+    Build fresh articles from a parsed feed.
+
+    Pass cutoff (from freshness_cutoff) to share one freshness window
+    across feeds; otherwise it is computed from freshness_hours.
+    """
+    if feed.bozo and feed.bozo_exception:
+        logger.warning(f"Feed parse warning: {feed.bozo_exception}")
+
+    articles = []
+    source_name = feed.feed.get("title", feed_url)
+    if cutoff is None:
+        cutoff = freshness_cutoff(freshness_hours)
+    stale_streak = 0
+
+    for entry in feed.entries[:max_articles]:
+        timestamp = parse_published_timestamp(entry)
+
+        if not is_fresh(timestamp, cutoff):
+            # Feeds are newest-first; a run of stale entries means the rest
+            # are stale too (a few out-of-order items are tolerated)
+            stale_streak += 1
+            if stale_streak >= STALE_STREAK_LIMIT:
+                break
+            continue
+        stale_streak = 0
+
+        # Only surviving entries pay for a datetime
+        published = (
+            datetime.fromtimestamp(timestamp, timezone.utc)
+            if timestamp is not None
+            else None
+        )
 
-    try:
-        feed = feedparser.parse(feed_url)
+        title, link, summary = _entry_fields(entry)
+        articles.append(Article(title, link, summary, source_name, topic, published))
 
-        if feed.bozo and feed.bozo_exception:
-            logger.warning(f"Feed parse warning: {feed.bozo_exception}")
+    logger.info(f"  -> {len(articles)} articles from {source_name}")
+    return articles
 
-        articles = []
-        source_name = feed.feed.get("title", feed_url)
 
-        for entry in feed.entries[:max_articles]:
-            published = parse_published_date(entry)
+def canonical_link(link: str) -> str:
+    """Normalize an article URL: lowercase host, no fragment or utm_* params."""
+    parts = urlsplit(link.strip())
+    params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ]
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(params), "")
+    )
 
-            if not is_fresh(published, freshness_hours):
-                continue
 
-            article = Article(
-                title=entry.get("title", "No title"),
-                link=entry.get("link", ""),
-                summary=entry.get("summary", entry.get("description", "")),
-                source=source_name,
-                topic=topic,
-                published=published,
+def dedupe_by_link(
+    articles: list[Article],
+    seen_links: set[str] | None = None,
+    seen_titles: set[str] | None = None,
+) -> list[Article]:
+    """
+    Drop articles reposted across feeds, keeping the first occurrence.
+
+    Articles match on canonical link, or on lowercased title when the links
+    differ (e.g. the same story via an aggregator). Pass the same seen sets
+    to dedupe across several calls; they are updated in place.
+    """
+    if seen_links is None:
+        seen_links = set()
+    if seen_titles is None:
+        seen_titles = set()
+    unique = []
+
+    for article in articles:
+        link = canonical_link(article.link) if article.link else ""
+        title = article.title.strip().lower()
+        if title == DEFAULT_TITLE.lower():
+            title = ""
+
+        if (link and link in seen_links) or (title and title in seen_titles):
+            continue
+
+        if link:
+            seen_links.add(link)
+        if title:
+            seen_titles.add(title)
+        unique.append(article)
+
+    return unique
+
+
+async def fetch_single_feed_async(
+    session: aiohttp.ClientSession,
+    feed_url: str,
+    topic: str,
+    max_articles: int = 50,
+    freshness_hours: int = 24,
+    feed_cache: FeedCache | None = None,
+    cutoff: float | None = None,
+) -> list[Article]:
+    """
+    Fetch articles from a single RSS feed over a shared HTTP session.
+
+    Results from the last 15 minutes are served from memory. Otherwise,
+    with a feed_cache, sends a conditional GET and reuses the previous
+    articles when the feed answers 304 Not Modified.
+    """
+    if cutoff is None:
+        cutoff = freshness_cutoff(freshness_hours)
+
+    key = (feed_url, topic, freshness_hours, max_articles)
+    if key in _ARTICLE_CACHE:
+        logger.info(f"Cached: {feed_url}")
+        return _ARTICLE_CACHE[key]
+
+    logger.info(f"Fetching: {feed_url}")
+
+    cached = feed_cache.get(feed_url, max_articles, freshness_hours) if feed_cache else None
+    headers = {}
+    if cached:
+        etag, modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+    try:
+        async with session.get(feed_url, headers=headers) as response:
+            if response.status == 304 and cached:
+                # The cache is keyed by URL; a feed listed under several
+                # topics must come back under the one asked for.
+                articles = [
+                    replace(a, topic=topic)
+                    for a in cached[2]
+                    if a.published is None or a.published.timestamp() >= cutoff
+                ][:max_articles]
+                feed_cache.touch(feed_url)
+                logger.info(f"  -> {len(articles)} cached articles (not modified)")
+                _ARTICLE_CACHE[key] = articles
+                return articles
+
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+            modified = response.headers.get("Last-Modified")
+            content_type = response.headers.get("Content-Type")
+
+        feed = parse_feed_lxml(body)
+        if feed is None and len(body) < INLINE_PARSE_MAX_BYTES:
+            # Malformed or unusual feed: use feedparser's lenient parser.
+            # Small bodies parse faster than a round trip to the pool.
+            feed = parse_feed(body, content_type)
+        elif feed is None:
+            loop = asyncio.get_running_loop()
+            feed = await loop.run_in_executor(
+                _PARSE_POOL, partial(parse_feed, body, content_type)
             )
-            articles.append(article)
+        articles = extract_articles(
+            feed, feed_url, topic, max_articles, freshness_hours, cutoff
+        )
 
-        logger.info(f"  -> {len(articles)} articles from {source_name}")
+        if feed_cache:
+            feed_cache.set(feed_url, etag, modified, max_articles, freshness_hours, articles)
+
+        _ARTICLE_CACHE[key] = articles
         return articles
 
     except Exception as e:
@@ -111,6 +524,108 @@ def fetch_single_feed(
         return []
 
 
+def new_http_session() -> aiohttp.ClientSession:
+    """
+    Create the HTTP session used for feed downloads.
+
+    Keep-alive connections and cached DNS are reused across feeds on the
+    same host.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_FETCHES,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        ),
+        headers={"User-Agent": feedparser.USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT),
+    )
+
+
+async def fetch_feeds_by_topic(
+    rss_feeds: dict[str, list[str]],
+    max_articles: int = 50,
+    freshness_hours: int = 24,
+) -> AsyncIterator[tuple[str, list[Article]]]:
+    """
+    Fetch all feeds concurrently, yielding (topic, articles) in config order.
+
+    Every feed starts downloading right away; each topic is yielded as soon
+    as it and the topics before it are done.
+    """
+    feed_cache = FeedCache()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    # One freshness window for the whole run
+    cutoff = freshness_cutoff(freshness_hours)
+
+    try:
+        async with AsyncExitStack() as stack:
+            # Outside run_server (tests, blocking helpers) use a session
+            # for this fetch only
+            session = _SESSION
+            if session is None:
+                session = await stack.enter_async_context(new_http_session())
+
+            async def fetch_one(feed_url: str, topic: str) -> list[Article]:
+                async with semaphore:
+                    return await fetch_single_feed_async(
+                        session,
+                        feed_url,
+                        topic,
+                        max_articles,
+                        freshness_hours,
+                        feed_cache,
+                        cutoff,
+                    )
+
+            async def fetch_topic(topic: str, feed_urls: list[str]) -> list[Article]:
+                results = await asyncio.gather(
+                    *(fetch_one(feed_url, topic) for feed_url in feed_urls)
+                )
+                return [article for articles in results for article in articles]
+
+            tasks = [
+                (topic, asyncio.ensure_future(fetch_topic(topic, feed_urls)))
+                for topic, feed_urls in rss_feeds.items()
+            ]
+            try:
+                for topic, task in tasks:
+                    yield topic, await task
+            finally:
+                for _, task in tasks:
+                    task.cancel()
+    finally:
+        feed_cache.close()
+
+
+async def fetch_all_feeds(
+    rss_feeds: dict[str, list[str]],
+    max_articles: int = 50,
+    freshness_hours: int = 24,
+) -> list[Article]:
+    """Fetch all feeds concurrently, returning articles in config order."""
+    return [
+        article
+        async for _, articles in fetch_feeds_by_topic(
+            rss_feeds, max_articles, freshness_hours
+        )
+        for article in articles
+    ]
+
+
+def fetch_single_feed(
+    feed_url: str,
+    topic: str,
+    max_articles: int = 50,
+    freshness_hours: int = 24,
+) -> list[Article]:
+    """Fetch articles from a single RSS feed (blocking)."""
+    return asyncio.run(
+        fetch_all_feeds({topic: [feed_url]}, max_articles, freshness_hours)
+    )
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available MCP tools."""
@@ -145,6 +660,11 @@ async def list_tools() -> list[Tool]:
             description="List all available news topics.",
             inputSchema={"type": "object", "properties": {}, "required": []},
         ),
+        Tool(
+            name="clear_cache",
+            description="Forget recently fetched articles so the next fetch hits every feed.",
+            inputSchema={"type": "object", "properties": {}, "required": []},
+        ),
     ]
 
 
@@ -155,7 +675,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     if name == "list_topics":
         config = load_sources_config()
         topics = list(config.get("rss_feeds", {}).keys())
-        return [TextContent(type="text", text=json.dumps({"topics": topics}))]
+        return [TextContent(type="text", text=orjson.dumps({"topics": topics}).decode())]
 
     elif name == "fetch_feeds":
         topics_filter = arguments.get("topics", [])
@@ -168,32 +688,53 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         if topics_filter:
             rss_feeds = {k: v for k, v in rss_feeds.items() if k in topics_filter}
 
-        all_articles = []
-        for topic, feed_urls in rss_feeds.items():
-            for feed_url in feed_urls:
-                articles = fetch_single_feed(
-                    feed_url, topic, max_articles, freshness_hours
-                )
-                all_articles.extend(articles)
-
-        articles_data = [a.to_dict() for a in all_articles]
-
-        return [TextContent(
-            type="text",
-            text=json.dumps({"count": len(articles_data), "articles": articles_data}, default=str)
-        )]
+        # One text part per topic, each serialized as soon as its feeds are
+        # in while later topics keep downloading. orjson serializes the
+        # Article dataclasses (and their datetimes) directly, in the same
+        # shape as Article.to_dict().
+        parts = []
+        seen_links: set[str] = set()
+        seen_titles: set[str] = set()
+        async for topic, articles in fetch_feeds_by_topic(
+            rss_feeds, max_articles, freshness_hours
+        ):
+            articles = dedupe_by_link(articles, seen_links, seen_titles)
+            parts.append(TextContent(
+                type="text",
+                text=orjson.dumps(
+                    {"topic": topic, "count": len(articles), "articles": articles}
+                ).decode(),
+            ))
+
+        if not parts:
+            parts.append(TextContent(
+                type="text", text=orjson.dumps({"count": 0, "articles": []}).decode()
+            ))
+        return parts
+
+    elif name == "clear_cache":
+        cleared = len(_ARTICLE_CACHE)
+        _ARTICLE_CACHE.clear()
+        return [TextContent(type="text", text=orjson.dumps({"cleared": cleared}).decode())]
 
     return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
 
 async def run_server():
     """Run MCP server with stdio transport."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    global _SESSION
+
+    async with new_http_session() as session:
+        _SESSION = session
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+        finally:
+            _SESSION = None
 
 
 def test_mode():
@@ -207,17 +748,21 @@ def test_mode():
     freshness_hours = settings.get("freshness_hours", 24)
     rss_feeds = config.get("rss_feeds", {})
 
-    total = 0
-    for topic, feed_urls in rss_feeds.items():
-        if feed_urls:
-            articles = fetch_single_feed(
-                feed_urls[0], topic, max_articles=5, freshness_hours=freshness_hours
-            )
-            total += len(articles)
-
-            print(f"\n[{topic.upper()}] {len(articles)} articles:")
-            for a in articles[:3]:
-                print(f"  - {a.title[:60]}...")
+    # First feed of each topic, all fetched at once
+    test_feeds = {
+        topic: feed_urls[:1] for topic, feed_urls in rss_feeds.items() if feed_urls
+    }
+    all_articles = asyncio.run(
+        fetch_all_feeds(test_feeds, max_articles=5, freshness_hours=freshness_hours)
+    )
+
+    total = len(all_articles)
+    for topic in test_feeds:
+        articles = [a for a in all_articles if a.topic == topic]
+
+        print(f"\n[{topic.upper()}] {len(articles)} articles:")
+        for a in articles[:3]:
+            print(f"  - {a.title[:60]}...")
 
     print(f"\n{'='*50}")
     print(f"Total: {total} articles fetched from {len(rss_feeds)} topics")
@@ -6,8 +6,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Article:
     """
     Standardized article representation.
@@ -57,3 +59,40 @@ class Article:
             score=data.get("score", 0.0),
             ai_summary=data.get("ai_summary", ""),
         )
+
+
+@dataclass(slots=True)
+class ArticleTable:
+    """
+    Column view over a list of article dicts (structure of arrays).
+
+    Hot columns are held in NumPy arrays so dedupe masks, score filters and
+    sorts run as vectorized passes. Rows stay the original dicts, which is
+    what crosses the MCP and email boundaries.
+    """
+
+    rows: list[dict]
+    titles: np.ndarray
+    scores: np.ndarray
+
+    @classmethod
+    def from_dicts(cls, rows: list[dict]) -> "ArticleTable":
+        """Build a table from article dicts."""
+        titles = np.empty(len(rows), dtype=object)
+        titles[:] = [row.get("title", "") for row in rows]
+        scores = np.fromiter(
+            (row.get("score", 0.0) for row in rows), dtype=np.float64, count=len(rows)
+        )
+        return cls(rows=rows, titles=titles, scores=scores)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def take(self, index: np.ndarray | slice) -> "ArticleTable":
+        """Select rows by boolean mask, integer indices or slice."""
+        selected = np.arange(len(self.rows))[index]
+        return ArticleTable(
+            rows=[self.rows[i] for i in selected],
+            titles=self.titles[selected],
+            scores=self.scores[selected],
+        )
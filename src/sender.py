@@ -4,9 +4,11 @@ Email sender for news digest delivery.
 Supports Gmail SMTP with app password authentication.
 """
 
+import asyncio
 import logging
 import os
 import smtplib
+import ssl
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from datetime import datetime
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)
 SMTP_HOST = "smtp.gmail.com"
 SMTP_PORT = 587
 
+# Built once: loading the system CA store is the costly part of STARTTLS setup
+_SSL_CONTEXT = ssl.create_default_context()
+
 
 def get_email_config() -> dict:
     """Load email configuration from environment."""
@@ -87,7 +92,7 @@ def send_gmail(
         logger.info(f"Connecting to {SMTP_HOST}:{SMTP_PORT}...")
 
         with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.starttls()
+            server.starttls(context=_SSL_CONTEXT)
             server.login(gmail_user, gmail_password)
             server.send_message(msg)
 
@@ -105,6 +110,30 @@ def send_gmail(
         return False
 
 
+async def send_gmail_async(
+    to: str,
+    subject: str,
+    html_body: str,
+    plain_body: str | None = None,
+) -> bool:
+    """
+    Send email via Gmail SMTP without blocking the event loop.
+
+    Runs send_gmail in a worker thread; STARTTLS, login and upload take
+    seconds.
+
+    Args:
+        to: Recipient email address.
+        subject: Email subject line.
+        html_body: HTML content.
+        plain_body: Plain text fallback (optional).
+
+    Returns:
+        True if sent successfully.
+    """
+    return await asyncio.to_thread(send_gmail, to, subject, html_body, plain_body)
+
+
 def send_digest(html_body: str) -> bool:
     """
     Send the news digest email.
@@ -130,6 +159,19 @@ def send_digest(html_body: str) -> bool:
     )
 
 
+async def send_digest_async(html_body: str) -> bool:
+    """
+    Async version of send_digest.
+
+    Args:
+        html_body: HTML content of the digest.
+
+    Returns:
+        True if sent successfully.
+    """
+    return await asyncio.to_thread(send_digest, html_body)
+
+
 def test_mode():
     """Test email sending with a simple message."""
     logging.basicConfig(level=logging.INFO, format="%(message)s")
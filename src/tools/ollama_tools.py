@@ -4,26 +4,90 @@ Ollama LLM tools for article scoring and summarization.
 Uses local Ollama with Llama 3.1 8B for $0 cost operation.
 """
 
+import asyncio
 import json
 import logging
 import re
+import weakref
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
 from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from config import load_yaml
+
 logger = logging.getLogger(__name__)
 
 # Default model configuration
 DEFAULT_MODEL = "llama3.1:8b"
 OLLAMA_BASE_URL = "http://localhost:11434"
 
+TOPICS_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "topics.yaml"
+
+# Prompts in flight at once; Ollama queues anything beyond its parallel slots
+DEFAULT_BATCH_SIZE = 8
+
+# Articles packed into one prompt. Five articles (~1500 chars each) plus the
+# instructions and answers fit comfortably in DEFAULT_NUM_CTX.
+DEFAULT_ARTICLES_PER_PROMPT = 5
+
+# Context window in tokens; Ollama's 2048 default truncates multi-article prompts
+DEFAULT_NUM_CTX = 4096
+
+# How long Ollama keeps the model (and its prompt cache) loaded after a
+# request. Every prompt opens with the same system message and interests,
+# so a warm model only prefills the article text.
+DEFAULT_KEEP_ALIVE = "30m"
+
+_SCORING_GUIDE = """Scoring guide:
+- 9-10: Directly about user's high-priority interests, breaking/important news
+- 7-8: Relevant to user's interests, newsworthy
+- 5-6: Tangentially related, might be interesting
+- 3-4: Loosely connected to interests
+- 1-2: Not relevant to user's stated interests
+
+Summary rules:
+- 2-3 sentences maximum
+- Focus on key facts and why it matters
+- Use active voice, present tense
+- No marketing language or hype"""
+
+_SCORE_SYSTEM_MESSAGE = SystemMessage(content=f"""You are a news curator assistant. Your job is to evaluate articles for relevance and create concise summaries.
+
+Always respond with ONLY a JSON object in this exact format:
+{{"score": <number 1-10>, "summary": "<2-3 sentence summary>"}}
+
+{_SCORING_GUIDE}""")
+
+_BATCH_SCORE_SYSTEM_MESSAGE = SystemMessage(content=f"""You are a news curator assistant. Your job is to evaluate articles for relevance and create concise summaries.
+
+Always respond with ONLY a JSON array holding one object per article, in this exact format:
+[{{"id": <article number>, "score": <number 1-10>, "summary": "<2-3 sentence summary>"}}, ...]
+
+Evaluate each article on its own.
+
+{_SCORING_GUIDE}""")
+
+# get_llm clients by event loop (dropped with the loop) and for sync callers
+_LLM_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_SYNC_LLM_CLIENTS: dict[tuple[str, float], ChatOllama] = {}
+
+_JSON_DECODER = json.JSONDecoder()
+_SCORE_RE = re.compile(r"score[:\s]+(\d+(?:\.\d+)?)", re.I)
+_SUMMARY_RE = re.compile(r"summary[:\s]+(.+)", re.I | re.DOTALL)
+
 
 def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.3) -> ChatOllama:
     """
     Get configured Ollama LLM instance.
 
+    Cached per running event loop: the client's async HTTP connections are
+    bound to the loop they were opened on, so each asyncio.run gets its own
+    client while calls within a run share one. The model stays loaded for
+    DEFAULT_KEEP_ALIVE between requests so Ollama can reuse the shared
+    prompt prefix instead of reloading and re-prefilling.
+
     Args:
         model: Ollama model name.
         temperature: Sampling temperature (lower = more deterministic).
@@ -31,29 +95,47 @@ def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.3) -> ChatOllama:
     Returns:
         Configured ChatOllama instance.
     """
-    return ChatOllama(
-        model=model,
-        base_url=OLLAMA_BASE_URL,
-        temperature=temperature,
-    )
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None  # sync callers never touch the async client
+
+    clients = _LLM_CLIENTS.setdefault(loop, {}) if loop else _SYNC_LLM_CLIENTS
+
+    key = (model, temperature)
+    if key not in clients:
+        clients[key] = ChatOllama(
+            model=model,
+            base_url=OLLAMA_BASE_URL,
+            temperature=temperature,
+            num_ctx=DEFAULT_NUM_CTX,
+            keep_alive=DEFAULT_KEEP_ALIVE,
+        )
+    return clients[key]
 
 
 def load_user_interests() -> str:
     """
     Build user interest description from topics.yaml for LLM context.
 
+    Cached until topics.yaml is modified.
+
     Returns:
         Formatted string describing user's interests and priorities.
     """
-    config_path = Path(__file__).parent.parent.parent / "config" / "topics.yaml"
-
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        mtime_ns = TOPICS_CONFIG_PATH.stat().st_mtime_ns
+        return _build_user_interests(mtime_ns)
     except FileNotFoundError:
         logger.warning("topics.yaml not found, using default interests")
         return "AI, software development, technology, business, and current events"
 
+
+@lru_cache(maxsize=1)
+def _build_user_interests(mtime_ns: int) -> str:
+    """Read topics.yaml into an interests string (cache key is its mtime)."""
+    config = load_yaml(TOPICS_CONFIG_PATH)
+
     topics = config.get("topics", {})
 
     # Sort topics by weight (higher weight = more important)
@@ -97,23 +179,25 @@ def parse_score_response(response_text: str) -> tuple[float, str]:
     Returns:
         Tuple of (score, summary). Returns (0.0, "") on parse failure.
     """
-    # Try JSON parsing first
-    try:
-        json_match = re.search(r"\{[^}]+\}", response_text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
+    # Try JSON parsing first: decode from each "{" until an object parses,
+    # so braces inside the summary string don't cut it short
+    start = response_text.find("{")
+    while start != -1:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(response_text, start)
             score = float(data.get("score", 0))
             summary = str(data.get("summary", ""))
             return (min(score, 10), summary)
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.debug(f"JSON parse failed: {e}")
+        except (ValueError, TypeError) as e:
+            logger.debug(f"JSON parse failed: {e}")
+            start = response_text.find("{", start + 1)
 
     # Fallback: extract from plain text
     try:
-        score_match = re.search(r"score[:\s]+(\d+(?:\.\d+)?)", response_text, re.I)
+        score_match = _SCORE_RE.search(response_text)
         score = float(score_match.group(1)) if score_match else 0.0
 
-        summary_match = re.search(r"summary[:\s]+(.+)", response_text, re.I | re.DOTALL)
+        summary_match = _SUMMARY_RE.search(response_text)
         summary = summary_match.group(1).strip() if summary_match else ""
 
         return (min(score, 10), summary)
@@ -122,6 +206,123 @@ def parse_score_response(response_text: str) -> tuple[float, str]:
         return (0.0, "")
 
 
+def parse_batch_score_response(
+    response_text: str,
+    count: int,
+) -> list[tuple[float, str]] | None:
+    """
+    Parse a multi-article LLM response (JSON array of id/score/summary).
+
+    The response is only trusted when it numbers the articles exactly 1..count,
+    each once; anything else (missing, duplicate, shifted or unparsable ids)
+    could put a score on the wrong article.
+
+    Args:
+        response_text: Raw text response from LLM.
+        count: Number of articles in the prompt (ids 1..count).
+
+    Returns:
+        List of (score, summary) in article order, or None if the response
+        doesn't line up with the articles.
+    """
+    start = response_text.find("[")
+    while start != -1:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(response_text, start)
+            if isinstance(data, list) and any(isinstance(x, dict) for x in data):
+                break
+        except ValueError:
+            pass
+        start = response_text.find("[", start + 1)
+    else:
+        logger.debug("No JSON array in batch response")
+        return None
+
+    if len(data) != count:
+        return None
+
+    results: dict[int, tuple[float, str]] = {}
+    for item in data:
+        try:
+            article_id = int(item["id"])
+            score = float(item.get("score", 0))
+            summary = str(item.get("summary", ""))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        if article_id in results or not 1 <= article_id <= count:
+            return None
+        results[article_id] = (min(score, 10), summary)
+
+    return [results[i] for i in range(1, count + 1)]
+
+
+@lru_cache(maxsize=4)
+def _interests_prefix(interests: str) -> str:
+    """User prompt opening shared by every article scored under interests."""
+    return f"User interests:\n{interests}\n\n"
+
+
+def build_score_messages(
+    title: str,
+    content: str,
+    source: str,
+    interests: str,
+) -> list:
+    """
+    Build the chat messages for scoring and summarizing one article.
+
+    Args:
+        title: Article title.
+        content: Article content/summary.
+        source: Source name.
+        interests: User interests string.
+
+    Returns:
+        List of [SystemMessage, HumanMessage].
+    """
+    user_prompt = f"""{_interests_prefix(interests)}ARTICLE TO EVALUATE:
+Title: {title}
+Source: {source}
+Content: {content[:1500]}
+
+Respond with JSON only: {{"score": N, "summary": "..."}}"""
+
+    return [
+        _SCORE_SYSTEM_MESSAGE,
+        HumanMessage(content=user_prompt),
+    ]
+
+
+def build_batch_score_messages(
+    articles: list[tuple[str, str, str]],
+    interests: str,
+) -> list:
+    """
+    Build the chat messages for scoring and summarizing several articles.
+
+    Args:
+        articles: List of (title, content, source) tuples.
+        interests: User interests string.
+
+    Returns:
+        List of [SystemMessage, HumanMessage].
+    """
+    article_blocks = "\n\n".join(
+        f"{i}. Title: {title}\n   Source: {source}\n   Content: {content[:1500]}"
+        for i, (title, content, source) in enumerate(articles, 1)
+    )
+
+    user_prompt = f"""{_interests_prefix(interests)}ARTICLES TO EVALUATE:
+{article_blocks}
+
+Respond with a JSON array only, one entry per article: [{{"id": 1, "score": N, "summary": "..."}}, ...]"""
+
+    return [
+        _BATCH_SCORE_SYSTEM_MESSAGE,
+        HumanMessage(content=user_prompt),
+    ]
+
+
 def score_and_summarize_article(
     title: str,
     content: str,
@@ -148,41 +349,52 @@ def score_and_summarize_article(
     if llm is None:
         llm = get_llm()
 
-    system_prompt = """You are a news curator assistant. Your job is to evaluate articles for relevance and create concise summaries.
+    try:
+        messages = build_score_messages(title, content, source, interests)
 
-Always respond with ONLY a JSON object in this exact format:
-{"score": <number 1-10>, "summary": "<2-3 sentence summary>"}
+        response = llm.invoke(messages)
+        response_text = response.content
 
-Scoring guide:
-- 9-10: Directly about user's high-priority interests, breaking/important news
-- 7-8: Relevant to user's interests, newsworthy
-- 5-6: Tangentially related, might be interesting
-- 3-4: Loosely connected to interests
-- 1-2: Not relevant to user's stated interests
+        score, summary = parse_score_response(response_text)
+        logger.debug(f"Scored '{title[:50]}': {score}")
 
-Summary rules:
-- 2-3 sentences maximum
-- Focus on key facts and why it matters
-- Use active voice, present tense
-- No marketing language or hype"""
+        return (score, summary)
 
-    user_prompt = f"""User interests:
-{interests}
+    except Exception as e:
+        logger.error(f"LLM error scoring article: {e}")
+        return (0.0, "")
 
-ARTICLE TO EVALUATE:
-Title: {title}
-Source: {source}
-Content: {content[:1500]}
 
-Respond with JSON only: {{"score": N, "summary": "..."}}"""
+async def ascore_and_summarize_article(
+    title: str,
+    content: str,
+    source: str,
+    interests: str | None = None,
+    llm: ChatOllama | None = None,
+) -> tuple[float, str]:
+    """
+    Async version of score_and_summarize_article.
+
+    Args:
+        title: Article title.
+        content: Article content/summary.
+        source: Source name.
+        interests: User interests string. If None, loads from config.
+        llm: ChatOllama instance. If None, creates default.
+
+    Returns:
+        Tuple of (relevance_score 1-10, summary string).
+    """
+    if interests is None:
+        interests = load_user_interests()
+
+    if llm is None:
+        llm = get_llm()
 
     try:
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt),
-        ]
+        messages = build_score_messages(title, content, source, interests)
 
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
         response_text = response.content
 
         score, summary = parse_score_response(response_text)
@@ -195,6 +407,107 @@ Respond with JSON only: {{"score": N, "summary": "..."}}"""
         return (0.0, "")
 
 
+async def ascore_and_summarize_articles(
+    articles: list[tuple[str, str, str]],
+    interests: str,
+    llm: ChatOllama,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[tuple[float, str]]:
+    """
+    Score and summarize several articles in a single LLM call.
+
+    If the response doesn't line up with the articles (bad JSON, missing or
+    renumbered ids), the whole group is scored one article at a time.
+
+    Args:
+        articles: List of (title, content, source) tuples.
+        interests: User interests string.
+        llm: ChatOllama instance.
+        semaphore: Bounds concurrent Ollama requests, including fallback
+            requests. If None, allows DEFAULT_BATCH_SIZE.
+
+    Returns:
+        List of (relevance_score 1-10, summary string), in input order.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(DEFAULT_BATCH_SIZE)
+
+    async def score_one(title: str, content: str, source: str) -> tuple[float, str]:
+        async with semaphore:
+            return await ascore_and_summarize_article(
+                title, content, source, interests=interests, llm=llm
+            )
+
+    if len(articles) == 1:
+        return [await score_one(*articles[0])]
+
+    results = None
+    async with semaphore:
+        try:
+            messages = build_batch_score_messages(articles, interests)
+            response = await llm.ainvoke(messages)
+            results = parse_batch_score_response(response.content, len(articles))
+        except Exception as e:
+            logger.error(f"LLM error scoring batch: {e}")
+
+    if results is not None:
+        return results
+
+    logger.warning(
+        f"Batch response did not match its {len(articles)} articles, "
+        "scoring them individually"
+    )
+    return list(await asyncio.gather(*(score_one(*article) for article in articles)))
+
+
+async def score_and_summarize_batch(
+    articles: list[tuple[str, str, str]],
+    interests: str | None = None,
+    llm: ChatOllama | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    articles_per_prompt: int = DEFAULT_ARTICLES_PER_PROMPT,
+) -> list[tuple[float, str]]:
+    """
+    Score and summarize many articles, several per prompt.
+
+    Articles are packed articles_per_prompt to a prompt, so the instructions
+    and interests are sent (and prefilled) once per group instead of once
+    per article. Up to batch_size prompts are kept in flight; Ollama merges
+    concurrent requests into shared forward passes (up to its
+    OLLAMA_NUM_PARALLEL slots), and a new prompt starts as soon as one
+    finishes.
+
+    Args:
+        articles: List of (title, content, source) tuples.
+        interests: User interests string. If None, loads from config.
+        llm: ChatOllama instance. If None, creates default.
+        batch_size: Max concurrent requests sent to Ollama.
+        articles_per_prompt: Articles scored by each request.
+
+    Returns:
+        List of (relevance_score 1-10, summary string), in input order.
+    """
+    if interests is None:
+        interests = load_user_interests()
+
+    if llm is None:
+        llm = get_llm()
+
+    semaphore = asyncio.Semaphore(batch_size)
+    total = len(articles)
+
+    async def score_group(start: int) -> list[tuple[float, str]]:
+        group = articles[start:start + articles_per_prompt]
+        for i, (title, _, _) in enumerate(group, start + 1):
+            logger.info(f"  [{i}/{total}] {title[:50]}...")
+        return await ascore_and_summarize_articles(group, interests, llm, semaphore)
+
+    groups = await asyncio.gather(
+        *(score_group(start) for start in range(0, total, articles_per_prompt))
+    )
+    return [result for group in groups for result in group]
+
+
 def check_ollama_available(model: str = DEFAULT_MODEL) -> bool:
     """
     Check if Ollama is running and model is available.
@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: modules in src/ import each other by bare name.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -0,0 +1,80 @@
+"""
+Tests for removing duplicate articles across feeds.
+"""
+
+import numpy as np
+
+from agent import dedupe_mask
+from mcp_rss_server import DEFAULT_TITLE, canonical_link, dedupe_by_link
+from models import Article
+
+
+def _article(title: str, link: str) -> Article:
+    return Article(title, link, "", "Source", "AI")
+
+
+def test_canonical_link_drops_tracking_and_fragment():
+    assert (
+        canonical_link(" https://Example.COM/story?id=7&utm_source=rss&utm_medium=x#top ")
+        == "https://example.com/story?id=7"
+    )
+
+
+def test_dedupe_by_link_keeps_first_occurrence():
+    articles = [
+        _article("First story", "https://example.com/a?utm_source=feed1"),
+        _article("First story, reposted", "https://EXAMPLE.com/a#comments"),
+        _article("Second story", "https://example.com/b"),
+        _article("second STORY ", "https://aggregator.example/item/9"),
+    ]
+    unique = dedupe_by_link(articles)
+    assert [a.title for a in unique] == ["First story", "Second story"]
+
+
+def test_dedupe_by_link_ignores_placeholder_and_missing_fields():
+    articles = [
+        _article(DEFAULT_TITLE, "https://example.com/1"),
+        _article(DEFAULT_TITLE, "https://example.com/2"),
+        _article("Only a title", ""),
+        _article("Another title", ""),
+    ]
+    assert dedupe_by_link(articles) == articles
+
+
+def test_dedupe_by_link_shares_seen_sets_across_calls():
+    seen_links: set[str] = set()
+    seen_titles: set[str] = set()
+    first = dedupe_by_link(
+        [_article("Story", "https://example.com/a")], seen_links, seen_titles
+    )
+    second = dedupe_by_link(
+        [
+            _article("Story", "https://other.example/a"),
+            _article("Other", "https://example.com/a?utm_campaign=x"),
+            _article("New", "https://example.com/new"),
+        ],
+        seen_links,
+        seen_titles,
+    )
+    assert len(first) == 1
+    assert [a.title for a in second] == ["New"]
+
+
+def test_dedupe_mask_drops_near_duplicate_titles():
+    titles = np.array(
+        [
+            "OpenAI launches new reasoning model",
+            "OpenAI launches new reasoning model - The Verge",
+            "New reasoning model launches, OpenAI",
+            "Rust 2.0 released",
+        ],
+        dtype=object,
+    )
+    assert dedupe_mask(titles).tolist() == [True, False, False, True]
+
+
+def test_dedupe_mask_keeps_titles_that_only_contain_another():
+    titles = np.array(
+        ["Apple", "Apple unveils new iPhone at September event"], dtype=object
+    )
+    assert dedupe_mask(titles).tolist() == [True, True]
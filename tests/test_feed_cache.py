@@ -0,0 +1,93 @@
+"""
+Tests for conditional feed fetches backed by FeedCache.
+"""
+
+from pathlib import Path
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+import mcp_rss_server
+from cache import FeedCache
+from mcp_rss_server import fetch_single_feed_async
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+ETAG = '"v1"'
+
+
+@pytest_asyncio.fixture
+async def feed_server():
+    """Serve rss.xml with an ETag; yields (url, list of request ETags)."""
+    body = (FIXTURES / "rss.xml").read_bytes()
+    requests = []
+
+    async def handle(request: web.Request) -> web.Response:
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.Response(
+            body=body, content_type="application/rss+xml", headers={"ETag": ETAG}
+        )
+
+    app = web.Application()
+    app.router.add_get("/feed.xml", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/feed.xml", requests
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def feed_cache(tmp_path):
+    mcp_rss_server._ARTICLE_CACHE.clear()
+    cache = FeedCache(tmp_path / "feed_cache.sqlite")
+    yield cache
+    cache.close()
+    mcp_rss_server._ARTICLE_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_reuses_cached_articles(feed_server, feed_cache):
+    url, requests = feed_server
+    async with aiohttp.ClientSession() as session:
+        first = await fetch_single_feed_async(
+            session, url, "AI", feed_cache=feed_cache, cutoff=0.0
+        )
+        mcp_rss_server._ARTICLE_CACHE.clear()
+        second = await fetch_single_feed_async(
+            session, url, "Tech", feed_cache=feed_cache, cutoff=0.0
+        )
+
+    assert requests == [None, ETAG]
+    assert len(first) == 3
+    assert [a.link for a in second] == [a.link for a in first]
+    assert [a.title for a in second] == [a.title for a in first]
+    # Same feed under another topic: the cached articles take the new topic
+    assert {a.topic for a in first} == {"AI"}
+    assert {a.topic for a in second} == {"Tech"}
+
+
+@pytest.mark.asyncio
+async def test_recent_fetch_is_served_per_topic(feed_server):
+    url, requests = feed_server
+    mcp_rss_server._ARTICLE_CACHE.clear()
+    try:
+        async with aiohttp.ClientSession() as session:
+            first = await fetch_single_feed_async(session, url, "AI", cutoff=0.0)
+            again = await fetch_single_feed_async(session, url, "AI", cutoff=0.0)
+            other = await fetch_single_feed_async(session, url, "Tech", cutoff=0.0)
+    finally:
+        mcp_rss_server._ARTICLE_CACHE.clear()
+
+    # The repeat comes from memory; another topic is fetched under its own key
+    assert again is first
+    assert len(requests) == 2
+    assert {a.topic for a in other} == {"Tech"}
@@ -0,0 +1,70 @@
+"""
+Tests for the lxml feed parser, checked against feedparser.
+"""
+
+import html
+import re
+from pathlib import Path
+
+import pytest
+
+from mcp_rss_server import extract_articles, parse_feed, parse_feed_lxml
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# No freshness filtering: fixture dates are fixed
+NO_CUTOFF = 0.0
+
+
+def _plain_title(entry) -> str:
+    """feedparser's title as the plain text parse_feed_lxml produces."""
+    title = entry.get("title", "")
+    if entry.get("title_detail", {}).get("type") == "text/html":
+        title = html.unescape(re.sub(r"<[^>]+>", "", title)).strip()
+    return title
+
+
+@pytest.mark.parametrize("name", ["rss.xml", "rdf.xml", "atom.xml", "rich.xml"])
+def test_lxml_matches_feedparser(name):
+    body = (FIXTURES / name).read_bytes()
+    fast = parse_feed_lxml(body)
+    slow = parse_feed(body)
+    assert fast is not None
+
+    fast_articles = extract_articles(fast, name, "AI", cutoff=NO_CUTOFF)
+    slow_articles = extract_articles(slow, name, "AI", cutoff=NO_CUTOFF)
+    assert len(fast_articles) == len(slow_articles) > 0
+
+    for fast_article, slow_article, entry in zip(
+        fast_articles, slow_articles, slow.entries
+    ):
+        assert fast_article.source == slow_article.source
+        assert fast_article.title == _plain_title(entry)
+        assert fast_article.link == slow_article.link
+        assert fast_article.summary == slow_article.summary
+        assert fast_article.published == slow_article.published
+
+
+def test_malformed_feed_falls_back():
+    body = (FIXTURES / "broken.xml").read_bytes()
+    assert parse_feed_lxml(body) is None
+    assert parse_feed(body).bozo
+
+
+def test_html_title_is_unescaped():
+    feed = parse_feed_lxml((FIXTURES / "atom.xml").read_bytes())
+    titles = [entry["title"] for entry in feed.entries]
+    assert titles == ["A & B", "Plain text entry", "Escaped markup"]
+
+
+def test_summaries_are_sanitized():
+    for name in ("rss.xml", "atom.xml"):
+        feed = parse_feed_lxml((FIXTURES / name).read_bytes())
+        for entry in feed.entries:
+            summary = entry.get("summary", "")
+            assert "<script" not in summary
+            assert "<iframe" not in summary
+            assert not re.search(r"\son\w+=", summary)
+
+    feed = parse_feed_lxml((FIXTURES / "atom.xml").read_bytes())
+    assert feed.entries[2]["summary"] == "<p>Hello <b>world</b></p>"
@@ -0,0 +1,168 @@
+"""
+Tests for LLM scoring: batch response parsing, the per-article fallback
+and client reuse across event loops.
+"""
+
+import asyncio
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tools import ollama_tools
+from tools.ollama_tools import (
+    _BATCH_SCORE_SYSTEM_MESSAGE,
+    ascore_and_summarize_articles,
+    get_llm,
+    parse_batch_score_response,
+    score_and_summarize_batch,
+)
+
+
+def _reply(ids: list[int]) -> str:
+    return json.dumps([{"id": i, "score": i + 5, "summary": f"s{i}"} for i in ids])
+
+
+def test_batch_response_in_any_order():
+    assert parse_batch_score_response(_reply([2, 3, 1]), 3) == [
+        (6.0, "s1"),
+        (7.0, "s2"),
+        (8.0, "s3"),
+    ]
+
+
+def test_batch_response_with_surrounding_text():
+    text = f"Here you go:\n{_reply([1, 2])}\nHope that helps [really]."
+    assert parse_batch_score_response(text, 2) == [(6.0, "s1"), (7.0, "s2")]
+
+
+def test_batch_response_caps_score():
+    text = '[{"id": 1, "score": 42, "summary": "x"}]'
+    assert parse_batch_score_response(text, 1) == [(10.0, "x")]
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        [0, 1, 2],  # numbered from zero
+        [1, 1, 2],  # duplicate id
+        [1, 2],  # missing article
+        [1, 2, 3, 4],  # extra article
+    ],
+)
+def test_batch_response_with_wrong_ids_is_rejected(ids):
+    assert parse_batch_score_response(_reply(ids), 3) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "no json here",
+        '[{"id": "one", "score": 5}]',
+        '[{"score": 5, "summary": "no id"}]',
+    ],
+)
+def test_unusable_batch_response_is_rejected(text):
+    assert parse_batch_score_response(text, 1) is None
+
+
+class FakeLLM:
+    """Answers batch prompts with ids numbered from zero, so they must fall back."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        prompt = messages[-1].content
+        if messages[0] is _BATCH_SCORE_SYSTEM_MESSAGE:
+            count = len(re.findall(r"^\d+\. Title:", prompt, re.M))
+            content = _reply(list(range(count)))
+        else:
+            number = int(re.search(r"Title: Story (\d+)", prompt).group(1))
+            content = json.dumps({"score": number, "summary": f"story {number}"})
+        return type("Response", (), {"content": content})()
+
+
+def _articles(count: int) -> list[tuple[str, str, str]]:
+    return [(f"Story {i}", f"Body {i}", "Source") for i in range(1, count + 1)]
+
+
+@pytest.mark.asyncio
+async def test_mismatched_batch_rescores_every_article():
+    llm = FakeLLM()
+    results = await ascore_and_summarize_articles(_articles(3), "AI", llm)
+
+    assert results == [(1.0, "story 1"), (2.0, "story 2"), (3.0, "story 3")]
+    assert llm.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_fallback_requests_respect_batch_size():
+    llm = FakeLLM()
+    results = await score_and_summarize_batch(
+        _articles(9), "AI", llm, batch_size=2, articles_per_prompt=3
+    )
+
+    assert [score for score, _ in results] == [float(i) for i in range(1, 10)]
+    assert llm.max_in_flight <= 2
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal /api/chat that keeps connections alive, like Ollama does."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps(
+            {
+                "model": request["model"],
+                "created_at": "2026-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": _reply([1, 2])},
+                "done": True,
+                "done_reason": "stop",
+            }
+        ).encode() + b"\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        ollama_tools, "OLLAMA_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_llm_scores_across_event_loops(fake_ollama):
+    async def run():
+        return await score_and_summarize_batch(_articles(2), "AI", get_llm())
+
+    # Back-to-back pipeline runs, each with its own event loop
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+    assert first == second == [(6.0, "s1"), (7.0, "s2")]
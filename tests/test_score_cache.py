@@ -0,0 +1,125 @@
+"""
+Tests for the persistent LLM score cache and its use in score_node.
+"""
+
+import asyncio
+
+import pytest
+
+import agent
+import cache
+from cache import ScoreCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for last_used ordering."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    return now
+
+
+def _key(n: int) -> str:
+    return ScoreCache.make_key(f"title {n}", "content", "source", "AI", "model")
+
+
+def test_make_key_depends_on_every_field():
+    base = ("title", "content", "source", "AI", "model")
+    keys = {ScoreCache.make_key(*base)}
+    for i in range(len(base)):
+        changed = list(base)
+        changed[i] += "!"
+        keys.add(ScoreCache.make_key(*changed))
+    assert len(keys) == len(base) + 1
+    # Field boundaries matter: ("ab", "c") and ("a", "bc") differ
+    assert ScoreCache.make_key("ab", "c", "", "", "") != ScoreCache.make_key(
+        "a", "bc", "", "", ""
+    )
+
+
+def test_round_trip_persists(tmp_path):
+    path = tmp_path / "scores.sqlite"
+    store = ScoreCache(path)
+    store.set_many({_key(1): (7.0, "summary one")})
+    store.close()
+
+    store = ScoreCache(path)
+    try:
+        assert store.get_many([_key(1), _key(2)]) == {_key(1): (7.0, "summary one")}
+    finally:
+        store.close()
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    store = ScoreCache(tmp_path / "scores.sqlite", max_entries=2)
+    try:
+        store.set_many({_key(1): (1.0, "a")})
+        clock[0] += 1
+        store.set_many({_key(2): (2.0, "b")})
+        clock[0] += 1
+        # A hit refreshes key 1, so key 2 is now the oldest
+        assert store.get_many([_key(1)]) == {_key(1): (1.0, "a")}
+        clock[0] += 1
+        store.set_many({_key(3): (3.0, "c")})
+
+        assert set(store.get_many([_key(1), _key(2), _key(3)])) == {_key(1), _key(3)}
+    finally:
+        store.close()
+
+
+def test_get_many_past_parameter_chunk(tmp_path):
+    store = ScoreCache(tmp_path / "scores.sqlite")
+    try:
+        keys = [_key(n) for n in range(1234)]
+        store.set_many({key: (float(n % 10), f"s{n}") for n, key in enumerate(keys)})
+
+        # Duplicates and misses mixed in, spanning several 500-key chunks
+        found = store.get_many(keys + keys[:10] + [_key(-1)])
+        assert len(found) == len(keys)
+        assert found[keys[0]] == (0.0, "s0")
+        assert found[keys[1233]] == (3.0, "s1233")
+    finally:
+        store.close()
+
+
+def test_score_node_caches_only_successful_results(tmp_path, monkeypatch):
+    path = tmp_path / "scores.sqlite"
+
+    class TmpScoreCache(ScoreCache):
+        def __init__(self):
+            super().__init__(path)
+
+    scored_batches = []
+
+    async def fake_batch(articles, interests=None, llm=None):
+        scored_batches.append([title for title, _, _ in articles])
+        # The first article's LLM call "fails"
+        return [
+            (0.0, "") if title == "Failing story" else (8.0, "good")
+            for title, _, _ in articles
+        ]
+
+    monkeypatch.setattr(agent, "ScoreCache", TmpScoreCache)
+    monkeypatch.setattr(agent, "score_and_summarize_batch", fake_batch)
+    monkeypatch.setattr(agent, "check_ollama_available", lambda: True)
+    monkeypatch.setattr(agent, "load_user_interests", lambda: "AI")
+    monkeypatch.setattr(agent, "get_llm", lambda: type("LLM", (), {"model": "fake"})())
+
+    state = {
+        "raw_articles": [
+            {"title": "Failing story", "link": "https://a.example/1", "source": "A"},
+            {"title": "Working story", "link": "https://b.example/2", "source": "B"},
+        ],
+        "min_score": 6.0,
+    }
+
+    first = asyncio.run(agent.score_node(state))
+    second = asyncio.run(agent.score_node(state))
+
+    assert [a["title"] for a in first["scored_articles"]] == ["Working story"]
+    assert second["scored_articles"] == first["scored_articles"]
+    # The failed article is retried; the successful one comes from the cache
+    assert scored_batches == [
+        ["Failing story", "Working story"],
+        ["Failing story"],
+    ]